@@ -1,7 +1,11 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, APIRouter, Depends
-from fastapi.responses import RedirectResponse
+from fastapi.responses import ORJSONResponse, RedirectResponse
 from src.config import Settings, get_settings
 from src.routers.day0_design_and_topology import org, nms, sites, apps, inventory
+from src.services.mist_engine import close_mist_client, get_mist_client
+from src.services.redis import close_redis_client
 
 # OpenAPI tag definitions for Swagger UI grouping.
 tags_metadata = [
@@ -31,11 +35,23 @@ tags_metadata = [
     },
 ]
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the shared Mist API client on startup and close shared clients on shutdown."""
+    get_mist_client()
+    yield
+    await close_mist_client()
+    await close_redis_client()
+
+
 app = FastAPI(
     title="Juniper Mist - Multi-Site Provisioning Service",
     description="Automates network infrastructure provisioning using the Juniper Mist Cloud API.",
     version="1.0.0",
     openapi_tags=tags_metadata,
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 status_router = APIRouter(tags=["system"])
@@ -17,7 +17,7 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
 
 from src.services.mist_engine import MistEngine
-from src.services.redis import get_api_host, get_org_id
+from src.services.redis import get_org_context
 
 
 router = APIRouter(prefix="/apps", tags=["Applications - Day 0"])
@@ -102,7 +102,7 @@ async def list_apps():
 
     These define "Interesting Traffic" for traffic classification and AppQoE.
     """
-    api_host, org_id = get_api_host(), get_org_id()
+    api_host, org_id = await get_org_context()
     if not api_host or not org_id:
         raise HTTPException(
             status_code=400,
@@ -144,7 +144,7 @@ async def create_app(request: AppCreate):
     - Zoom: hostnames=["*.zoom.us"], traffic_class="high"
     - Salesforce: hostnames=["*.salesforce.com", "*.force.com"]
     """
-    api_host, org_id = get_api_host(), get_org_id()
+    api_host, org_id = await get_org_context()
     if not api_host or not org_id:
         raise HTTPException(
             status_code=400,
@@ -173,7 +173,7 @@ async def create_app(request: AppCreate):
 @router.get("/{app_id}", response_model=App, summary="Get application details")
 async def get_app(app_id: str):
     """Get detailed information about a specific application signature."""
-    api_host, org_id = get_api_host(), get_org_id()
+    api_host, org_id = await get_org_context()
     if not api_host or not org_id:
         raise HTTPException(
             status_code=400,
@@ -201,7 +201,7 @@ async def get_app(app_id: str):
 @router.put("/{app_id}", response_model=App, summary="Update application")
 async def update_app(app_id: str, request: AppUpdate):
     """Update an existing application signature."""
-    api_host, org_id = get_api_host(), get_org_id()
+    api_host, org_id = await get_org_context()
     if not api_host or not org_id:
         raise HTTPException(
             status_code=400,
@@ -234,7 +234,7 @@ async def delete_app(app_id: str):
 
     WARNING: This may affect WAN policies that reference this application.
     """
-    api_host, org_id = get_api_host(), get_org_id()
+    api_host, org_id = await get_org_context()
     if not api_host or not org_id:
         raise HTTPException(
             status_code=400,
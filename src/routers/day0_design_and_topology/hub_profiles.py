@@ -18,7 +18,7 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
 
 from src.services.mist_engine import MistEngine
-from src.services.redis import get_api_host, get_org_id
+from src.services.redis import get_org_context
 
 
 router = APIRouter(prefix="/hub-profiles", tags=["Hub Profiles - Day 0"])
@@ -116,7 +116,7 @@ async def list_hub_profiles():
     Hub profiles define WAN Edge configurations for datacenter sites.
     They create overlay endpoints that spoke sites connect to via IPsec tunnels.
     """
-    api_host, org_id = get_api_host(), get_org_id()
+    api_host, org_id = await get_org_context()
     if not api_host or not org_id:
         raise HTTPException(
             status_code=400,
@@ -156,7 +156,7 @@ async def create_hub_profile(request: HubProfileCreate):
     Hub devices require static IPs for overlay endpoints. The Mist cloud
     automatically generates and installs SSL certificates for the hub.
     """
-    api_host, org_id = get_api_host(), get_org_id()
+    api_host, org_id = await get_org_context()
     if not api_host or not org_id:
         raise HTTPException(
             status_code=400,
@@ -184,7 +184,7 @@ async def create_hub_profile(request: HubProfileCreate):
 @router.get("/{hubprofile_id}", response_model=HubProfile, summary="Get hub profile details")
 async def get_hub_profile(hubprofile_id: str):
     """Get detailed information about a specific hub profile."""
-    api_host, org_id = get_api_host(), get_org_id()
+    api_host, org_id = await get_org_context()
     if not api_host or not org_id:
         raise HTTPException(
             status_code=400,
@@ -215,7 +215,7 @@ async def update_hub_profile(hubprofile_id: str, request: HubProfileUpdate):
 
     Changes to WAN interfaces may affect spoke connectivity.
     """
-    api_host, org_id = get_api_host(), get_org_id()
+    api_host, org_id = await get_org_context()
     if not api_host or not org_id:
         raise HTTPException(
             status_code=400,
@@ -248,7 +248,7 @@ async def delete_hub_profile(hubprofile_id: str):
     WARNING: This will break connectivity for any spokes referencing this hub.
     Ensure all spoke templates are updated before deleting a hub profile.
     """
-    api_host, org_id = get_api_host(), get_org_id()
+    api_host, org_id = await get_org_context()
     if not api_host or not org_id:
         raise HTTPException(
             status_code=400,
@@ -10,10 +10,11 @@ Mist API Reference:
 from enum import Enum
 
 from fastapi import APIRouter, HTTPException, Query
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
+from src.services.cache import cache_config, invalidate_cache
 from src.services.mist_engine import MistEngine
-from src.services.redis import get_api_host, get_org_id
+from src.services.redis import get_org_context
 
 
 router = APIRouter(prefix="/inventory", tags=["Inventory - Day 0"])
@@ -53,7 +54,7 @@ class UnassignDevice(BaseModel):
 
 class InventoryDevice(BaseModel):
     """Device in inventory."""
-    serial: str
+    serial: str = ""
     mac: str | None = None
     model: str | None = None
     type: DeviceType | None = None
@@ -71,11 +72,16 @@ class InventoryResponse(BaseModel):
     page: int
 
 
+# Validates a whole Mist inventory page in one pydantic-core pass.
+_InventoryDeviceList = TypeAdapter(list[InventoryDevice])
+
+
 # =============================================================================
 # Endpoints
 # =============================================================================
 
 @router.get("/", summary="List all inventory devices")
+@cache_config(namespace="inventory", ttl_seconds=5)
 async def list_inventory(
     type: DeviceType | None = Query(None, description="Filter by device type"),
     unassigned: bool = Query(False, description="Only show unassigned devices"),
@@ -90,7 +96,7 @@ async def list_inventory(
     - **limit**: Results per page (max 1000)
     - **page**: Page number for pagination
     """
-    api_host, org_id = get_api_host(), get_org_id()
+    api_host, org_id = await get_org_context()
     if not api_host or not org_id:
         raise HTTPException(
             status_code=400,
@@ -106,19 +112,7 @@ async def list_inventory(
 
     data = await engine.get(f"/api/v1/orgs/{org_id}/inventory", params=params)
 
-    devices = [
-        InventoryDevice(
-            serial=d.get("serial", ""),
-            mac=d.get("mac"),
-            model=d.get("model"),
-            type=d.get("type"),
-            site_id=d.get("site_id"),
-            site_name=d.get("site_name"),
-            name=d.get("name"),
-            connected=d.get("connected", False),
-        )
-        for d in data
-    ]
+    devices = _InventoryDeviceList.validate_python(data)
 
     return InventoryResponse(
         devices=devices,
@@ -129,9 +123,10 @@ async def list_inventory(
 
 
 @router.get("/{serial}", summary="Get device details")
+@cache_config(namespace="inventory", ttl_seconds=5)
 async def get_device(serial: str) -> InventoryDevice:
     """Get detailed information about a specific device by serial number."""
-    api_host, org_id = get_api_host(), get_org_id()
+    api_host, org_id = await get_org_context()
     if not api_host or not org_id:
         raise HTTPException(
             status_code=400,
@@ -166,7 +161,7 @@ async def assign_devices(request: DeviceAssignment):
     from Step 1. Devices will adopt site-specific configurations
     once assigned.
     """
-    api_host, org_id = get_api_host(), get_org_id()
+    api_host, org_id = await get_org_context()
     if not api_host or not org_id:
         raise HTTPException(
             status_code=400,
@@ -185,6 +180,7 @@ async def assign_devices(request: DeviceAssignment):
     ]
 
     result = await engine.put(f"/api/v1/orgs/{org_id}/inventory", json=payload)
+    await invalidate_cache("inventory")
 
     return {
         "site_id": request.site_id,
@@ -201,7 +197,7 @@ async def claim_devices(request: ClaimDevice):
     Claim devices to the organization using claim codes.
     Devices must be claimed before they can be assigned to sites.
     """
-    api_host, org_id = get_api_host(), get_org_id()
+    api_host, org_id = await get_org_context()
     if not api_host or not org_id:
         raise HTTPException(
             status_code=400,
@@ -210,6 +206,7 @@ async def claim_devices(request: ClaimDevice):
 
     engine = MistEngine(host=api_host)
     result = await engine.post(f"/api/v1/orgs/{org_id}/inventory", json=request.claim_codes)
+    await invalidate_cache("inventory")
 
     return {
         "org_id": org_id,
@@ -225,7 +222,7 @@ async def unassign_devices(request: UnassignDevice):
     Unassign devices from their current site.
     Devices remain in org inventory but are no longer site-assigned.
     """
-    api_host, org_id = get_api_host(), get_org_id()
+    api_host, org_id = await get_org_context()
     if not api_host or not org_id:
         raise HTTPException(
             status_code=400,
@@ -242,6 +239,7 @@ async def unassign_devices(request: UnassignDevice):
     ]
 
     result = await engine.put(f"/api/v1/orgs/{org_id}/inventory", json=payload)
+    await invalidate_cache("inventory")
 
     return {
         "serial_numbers": request.serial_numbers,
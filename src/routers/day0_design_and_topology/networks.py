@@ -16,7 +16,7 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
 
 from src.services.mist_engine import MistEngine
-from src.services.redis import get_api_host, get_org_id
+from src.services.redis import get_org_context
 
 
 router = APIRouter(prefix="/networks", tags=["Networks - Day 0"])
@@ -82,7 +82,7 @@ async def list_networks():
     Networks define traffic source groups (the "who") for application policies.
     They can represent VLANs, subnets, or logical groupings of users/devices.
     """
-    api_host, org_id = get_api_host(), get_org_id()
+    api_host, org_id = await get_org_context()
     if not api_host or not org_id:
         raise HTTPException(
             status_code=400,
@@ -121,7 +121,7 @@ async def create_network(request: NetworkCreate):
     - Corporate-LAN: subnet="10.0.0.0/8", vlan_id=100
     - Guest-WiFi: subnet="192.168.100.0/24", isolation=true
     """
-    api_host, org_id = get_api_host(), get_org_id()
+    api_host, org_id = await get_org_context()
     if not api_host or not org_id:
         raise HTTPException(
             status_code=400,
@@ -149,7 +149,7 @@ async def create_network(request: NetworkCreate):
 @router.get("/{network_id}", response_model=Network, summary="Get network details")
 async def get_network(network_id: str):
     """Get detailed information about a specific network definition."""
-    api_host, org_id = get_api_host(), get_org_id()
+    api_host, org_id = await get_org_context()
     if not api_host or not org_id:
         raise HTTPException(
             status_code=400,
@@ -176,7 +176,7 @@ async def get_network(network_id: str):
 @router.put("/{network_id}", response_model=Network, summary="Update network")
 async def update_network(network_id: str, request: NetworkUpdate):
     """Update an existing network definition."""
-    api_host, org_id = get_api_host(), get_org_id()
+    api_host, org_id = await get_org_context()
     if not api_host or not org_id:
         raise HTTPException(
             status_code=400,
@@ -208,7 +208,7 @@ async def delete_network(network_id: str):
 
     WARNING: This may affect application policies that reference this network.
     """
-    api_host, org_id = get_api_host(), get_org_id()
+    api_host, org_id = await get_org_context()
     if not api_host or not org_id:
         raise HTTPException(
             status_code=400,
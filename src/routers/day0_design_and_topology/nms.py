@@ -56,7 +56,7 @@ async def set_profile(profile: DeploymentProfile):
     during site provisioning workflows.
     """
     redis_client = get_redis_client()
-    redis_client.set(NMS_KEY, profile.model_dump_json())
+    await redis_client.set(NMS_KEY, profile.model_dump_json())
     return {"status": "saved", "profile": profile.model_dump()}
 
 
@@ -64,7 +64,7 @@ async def set_profile(profile: DeploymentProfile):
 async def get_profile():
     """Retrieves the current NMS profile from Redis for use in provisioning workflows."""
     redis_client = get_redis_client()
-    data = redis_client.get(NMS_KEY)
+    data = await redis_client.get(NMS_KEY)
 
     if not data:
         raise HTTPException(status_code=404, detail="NMS profile not found")
@@ -77,5 +77,5 @@ async def get_profile():
 async def delete_profile():
     """Removes the NMS profile from Redis, allowing a fresh start for a new site."""
     redis_client = get_redis_client()
-    redis_client.delete(NMS_KEY)
+    await redis_client.delete(NMS_KEY)
     return {"status": "deleted"}
\ No newline at end of file
@@ -11,8 +11,9 @@ import fnc
 from fastapi import APIRouter
 from pydantic import BaseModel, Field
 
+from src.services.cache import invalidate_cache
 from src.services.mist_engine import MistEngine
-from src.services.redis import get_redis_client
+from src.services.redis import set_org_context
 
 
 router = APIRouter(prefix="/org", tags=["day 0 - organization"])
@@ -64,10 +65,8 @@ async def get_self(
         if org_priv:
             org_id = org_priv.get("org_id")
     
-    # Save to Redis
-    redis_client = get_redis_client()
-    redis_client.set("api_host", request.api_host)
-    if org_id:
-        redis_client.set("org_id", org_id)
+    # Save to Redis; cached responses belong to the previous org context
+    await set_org_context(request.api_host, org_id)
+    await invalidate_cache()
     
     return result
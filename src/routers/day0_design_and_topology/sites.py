@@ -14,12 +14,17 @@ import fnc
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel, Field
 
+from src.services.cache import cache_config, invalidate_cache
 from src.services.mist_engine import MistEngine
-from src.services.redis import get_api_host, get_org_id
+from src.services.network_calculator import MAX_ZONE_ID, IPAllocation, get_network_calculator
+from src.services.redis import get_api_host, get_org_context
 
 
 router = APIRouter(prefix="/sites", tags=["Sites - Day 0"])
 
+# Upper bound on sites per bulk request; each site is one Mist API POST.
+MAX_BULK_SITES = 100
+
 
 # =============================================================================
 # Models
@@ -35,6 +40,13 @@ class SiteCreate(BaseModel):
     notes: str | None = Field(None, description="Optional notes for the site")
 
 
+class SiteBulkCreate(BaseModel):
+    """Request payload for creating many sites at once."""
+    sites: list[SiteCreate] = Field(
+        ..., min_length=1, max_length=MAX_BULK_SITES, description="Sites to create"
+    )
+
+
 class SiteUpdate(BaseModel):
     """Request payload for updating a site."""
     name: str | None = Field(None, description="Site display name")
@@ -63,11 +75,34 @@ class SiteListResponse(BaseModel):
     count: int
 
 
+class SiteBulkResult(BaseModel):
+    """Outcome of one site in a bulk create."""
+    name: str
+    status: str
+    site: Site | None = None
+    error: str | None = None
+
+
+class SiteBulkResponse(BaseModel):
+    """Bulk create sites response."""
+    results: list[SiteBulkResult]
+    created: int
+    failed: int
+
+
+class SitePlanResponse(BaseModel):
+    """Bulk IP plan for every site slot in a zone."""
+    zone_id: int
+    allocations: list[IPAllocation]
+    count: int
+
+
 # =============================================================================
 # Endpoints
 # =============================================================================
 
 @router.get("/", response_model=SiteListResponse, summary="List all sites")
+@cache_config(namespace="sites", ttl_seconds=5)
 async def list_sites(
     site_name: str | None = Query(None, description="Filter by site name"),
 ):
@@ -76,7 +111,7 @@ async def list_sites(
 
     If site_name is provided, filters to sites matching that name.
     """
-    api_host, org_id = get_api_host(), get_org_id()
+    api_host, org_id = await get_org_context()
     if not api_host or not org_id:
         raise HTTPException(
             status_code=400,
@@ -107,6 +142,22 @@ async def list_sites(
     return SiteListResponse(sites=sites, count=len(sites))
 
 
+@router.get("/bulk-plan", response_model=SitePlanResponse, summary="Plan IP subnets for a whole zone")
+async def bulk_plan(
+    zone_id: int = Query(..., ge=1, le=MAX_ZONE_ID, description="Zone identifier"),
+):
+    """
+    Calculate the subnet allocation for every site ID (1-255) in a zone.
+
+    Pure calculation - no Mist API calls are made and nothing is provisioned.
+    """
+    site_ids = range(1, 256)
+    allocations = get_network_calculator().calculate_all_site_subnets(
+        [zone_id] * len(site_ids), site_ids
+    )
+    return SitePlanResponse(zone_id=zone_id, allocations=allocations, count=len(allocations))
+
+
 @router.post("/", response_model=Site, summary="Step 1: Create a new site")
 async def create_site(request: SiteCreate):
     """
@@ -115,7 +166,7 @@ async def create_site(request: SiteCreate):
     Creates a new site container in the Mist organization.
     This is the Digital Twin of the physical location.
     """
-    api_host, org_id = get_api_host(), get_org_id()
+    api_host, org_id = await get_org_context()
     if not api_host or not org_id:
         raise HTTPException(
             status_code=400,
@@ -125,6 +176,7 @@ async def create_site(request: SiteCreate):
     engine = MistEngine(host=api_host)
     payload = request.model_dump(exclude_none=True)
     result = await engine.post(f"/api/v1/orgs/{org_id}/sites", json=payload)
+    await invalidate_cache("sites")
 
     return Site(
         id=result.get("id", ""),
@@ -138,10 +190,61 @@ async def create_site(request: SiteCreate):
     )
 
 
+@router.post("/bulk", response_model=SiteBulkResponse, summary="Create many sites at once")
+async def create_sites_bulk(request: SiteBulkCreate):
+    """
+    Create several sites concurrently.
+
+    Sites are created in parallel (at most 20 Mist API calls in flight).
+    One site failing does not stop the others; each result reports
+    created or failed with the Mist error.
+    """
+    api_host, org_id = await get_org_context()
+    if not api_host or not org_id:
+        raise HTTPException(
+            status_code=400,
+            detail="Missing api_host or org_id. Call POST /org/self first."
+        )
+
+    engine = MistEngine(host=api_host)
+    responses = await engine.gather(*(
+        engine.post(f"/api/v1/orgs/{org_id}/sites", json=site.model_dump(exclude_none=True))
+        for site in request.sites
+    ))
+
+    results = []
+    for site, result in zip(request.sites, responses):
+        if isinstance(result, BaseException):
+            error = result.detail if isinstance(result, HTTPException) else (str(result) or type(result).__name__)
+            results.append(SiteBulkResult(name=site.name, status="failed", error=error))
+            continue
+        results.append(SiteBulkResult(
+            name=site.name,
+            status="created",
+            site=Site(
+                id=result.get("id", ""),
+                name=result.get("name", site.name),
+                address=result.get("address"),
+                timezone=result.get("timezone"),
+                country_code=result.get("country_code"),
+                latlng=result.get("latlng"),
+                notes=result.get("notes"),
+                org_id=result.get("org_id"),
+            ),
+        ))
+
+    created = sum(1 for r in results if r.status == "created")
+    if created:
+        await invalidate_cache("sites")
+
+    return SiteBulkResponse(results=results, created=created, failed=len(results) - created)
+
+
 @router.get("/{site_id}", response_model=Site, summary="Get site details")
+@cache_config(namespace="sites", ttl_seconds=5)
 async def get_site(site_id: str):
     """Get detailed information about a specific site."""
-    api_host = get_api_host()
+    api_host = await get_api_host()
     if not api_host:
         raise HTTPException(
             status_code=400,
@@ -166,7 +269,7 @@ async def get_site(site_id: str):
 @router.put("/{site_id}", response_model=Site, summary="Update site")
 async def update_site(site_id: str, request: SiteUpdate):
     """Update an existing site's configuration."""
-    api_host = get_api_host()
+    api_host = await get_api_host()
     if not api_host:
         raise HTTPException(
             status_code=400,
@@ -176,6 +279,7 @@ async def update_site(site_id: str, request: SiteUpdate):
     engine = MistEngine(host=api_host)
     payload = request.model_dump(exclude_none=True)
     result = await engine.put(f"/api/v1/sites/{site_id}", json=payload)
+    await invalidate_cache("sites")
 
     return Site(
         id=result.get("id", site_id),
@@ -197,7 +301,7 @@ async def delete_site(site_id: str):
     WARNING: This will remove all site-specific configurations.
     Devices assigned to this site will become unassigned.
     """
-    api_host = get_api_host()
+    api_host = await get_api_host()
     if not api_host:
         raise HTTPException(
             status_code=400,
@@ -206,5 +310,8 @@ async def delete_site(site_id: str):
 
     engine = MistEngine(host=api_host)
     await engine.delete(f"/api/v1/sites/{site_id}")
+    await invalidate_cache("sites")
+    # Deleting a site unassigns its devices
+    await invalidate_cache("inventory")
 
     return {"id": site_id, "status": "deleted"}
@@ -9,7 +9,7 @@ Day 2 operations focus on:
 - Client and device insights
 """
 from fastapi import APIRouter, Query
-from datetime import datetime
+from datetime import UTC, datetime
 
 from src.routers.day2_observability_assurance_and_aiops.models import (
     SiteHealthResponse,
@@ -29,6 +29,11 @@ router = APIRouter(prefix="/assurance", tags=["Assurance - Day 2"])
 # TODO: Implement authentication via dependency injection from central auth module
 
 
+def _iso_now() -> str:
+    """Current UTC time as an ISO 8601 string (datetime.utcnow is deprecated in 3.12)."""
+    return datetime.now(UTC).isoformat(timespec="seconds")
+
+
 # ============================================================================
 # Health & Status Endpoints
 # ============================================================================
@@ -57,7 +62,7 @@ async def get_site_health(
         wireless_health=91,
         active_alerts=2,
         connected_clients=145,
-        timestamp=datetime.utcnow().isoformat()
+        timestamp=_iso_now()
     )
 
 
@@ -86,7 +91,7 @@ async def get_device_health(
         uptime_seconds=864000,
         cpu_usage=23.5,
         memory_usage=45.2,
-        last_seen=datetime.utcnow().isoformat()
+        last_seen=_iso_now()
     )
 
 
@@ -128,7 +133,7 @@ async def get_client_detail(
         ip_address="10.1.5.42",
         signal_strength=-65,
         connection_quality="excellent",
-        connected_since=datetime.utcnow().isoformat()
+        connected_since=_iso_now()
     )
 
 
@@ -168,7 +173,7 @@ async def get_alert(
         message="AP-Floor2-003 has been disconnected for 15 minutes",
         site_id="site-1-5",
         device_id="ap-12345",
-        created_at=datetime.utcnow().isoformat(),
+        created_at=_iso_now(),
         acknowledged=False
     )
 
@@ -0,0 +1,106 @@
+"""
+Response Cache - Short-TTL Redis cache for idempotent GET endpoints.
+
+UIs poll site and inventory state; caching those reads for a few seconds
+keeps a 1Hz poll from becoming 1Hz Mist API traffic. Write endpoints call
+`invalidate_cache` so the next read sees their change.
+"""
+import functools
+from collections.abc import Awaitable, Callable
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from redis.exceptions import RedisError
+
+from src.services.redis import get_redis_client
+
+CACHE_PREFIX = "cache"
+
+# Namespaces registered by cache_config, so a full invalidation can
+# clear each index set directly instead of scanning the keyspace.
+_namespaces: set[str] = set()
+
+
+def _index_key(namespace: str) -> str:
+    """Redis set holding every live cache key in a namespace."""
+    return f"{CACHE_PREFIX}:{namespace}:index"
+
+
+def _generation_key(namespace: str) -> str:
+    """Counter bumped by every invalidation of a namespace."""
+    return f"{CACHE_PREFIX}:{namespace}:generation"
+
+
+def _cache_key(namespace: str, name: str, kwargs: dict) -> str:
+    """Build a deterministic key from the endpoint name and its arguments."""
+    args = orjson.dumps(jsonable_encoder(kwargs), option=orjson.OPT_SORT_KEYS).decode()
+    return f"{CACHE_PREFIX}:{namespace}:{name}:{args}"
+
+
+def cache_config(namespace: str, ttl_seconds: int) -> Callable:
+    """
+    Cache an endpoint's JSON response in Redis.
+
+    Redis errors are treated as a cache miss, so an unreachable cache
+    never fails the request. A response is only stored if the namespace
+    was not invalidated while it was being fetched, so a read that raced
+    a write cannot re-cache pre-write data.
+
+    Args:
+        namespace: Cache group cleared together by `invalidate_cache`
+        ttl_seconds: How long a cached response stays valid
+
+    Returns:
+        Decorator for an async endpoint function
+    """
+    _namespaces.add(namespace)
+
+    def decorator(func: Callable[..., Awaitable]) -> Callable[..., Awaitable]:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = _cache_key(namespace, func.__name__, kwargs)
+            redis_client = get_redis_client()
+
+            generation_key = _generation_key(namespace)
+
+            try:
+                cached, generation = await redis_client.get_many(key, generation_key)
+            except RedisError:
+                # Without a generation to check against, skip the store too
+                return await func(*args, **kwargs)
+            if cached is not None:
+                return orjson.loads(cached)
+
+            result = await func(*args, **kwargs)
+
+            try:
+                payload = orjson.dumps(jsonable_encoder(result)).decode()
+                await redis_client.set_indexed(
+                    key, payload, ttl_seconds, _index_key(namespace), generation_key, generation
+                )
+            except RedisError:
+                pass
+            return result
+
+        return wrapper
+    return decorator
+
+
+async def invalidate_cache(namespace: str | None = None) -> None:
+    """
+    Drop cached responses.
+
+    The namespace generation is bumped before the keys are deleted, so a
+    read already in flight will not store its now-stale result.
+
+    Args:
+        namespace: Cache group to clear. Clears every namespace if omitted.
+    """
+    namespaces = [namespace] if namespace else sorted(_namespaces)
+    redis_client = get_redis_client()
+    for name in namespaces:
+        try:
+            await redis_client.incr(_generation_key(name))
+            await redis_client.delete_indexed(_index_key(name))
+        except RedisError:
+            pass
@@ -1,11 +1,211 @@
 """
 Mist API Engine - Centralized API client with error handling.
 """
+import asyncio
+from collections.abc import AsyncIterator, Awaitable
+from contextlib import asynccontextmanager
+
 import httpx
+import orjson
 from fastapi import HTTPException
 
 from src.config import get_settings
 
+# =============================================================================
+# Shared HTTP Client
+# =============================================================================
+
+# One long-lived client per process so TCP connections, TLS sessions and
+# HTTP keep-alive are reused across Mist API calls. HTTP/2 multiplexes
+# concurrent requests to the same Mist host over a single connection.
+_client: httpx.AsyncClient | None = None
+
+
+def get_mist_client() -> httpx.AsyncClient:
+    """
+    Get the shared Mist API HTTP client, creating it on first use.
+
+    Returns:
+        Process-wide httpx.AsyncClient with pooled connections
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        settings = get_settings()
+        _client = httpx.AsyncClient(
+            headers={
+                "Authorization": f"Token {settings.mist_api_key}",
+                "Content-Type": "application/json"
+            },
+            limits=httpx.Limits(
+                max_connections=200,
+                max_keepalive_connections=100,
+                keepalive_expiry=30
+            ),
+            http2=True
+        )
+    return _client
+
+
+async def close_mist_client() -> None:
+    """Close the shared Mist API HTTP client and release its connections."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+# =============================================================================
+# Claim Batching
+# =============================================================================
+
+class ClaimBuffer:
+    """
+    Coalesces individual device claims into bulk Mist inventory calls.
+
+    Claim codes queued within `max_wait_ms` of the first pending code (or
+    until `max_batch` codes are pending) are sent as one
+    POST /api/v1/orgs/{org_id}/inventory request. Each caller gets back
+    the outcome for its own claim code.
+
+    Library helper for callers that claim devices one code at a time;
+    POST /inventory/claim already receives the full list and posts it
+    directly.
+    """
+
+    def __init__(
+        self,
+        engine: "MistEngine",
+        org_id: str,
+        max_batch: int = 100,
+        max_wait_ms: float = 50
+    ):
+        self._engine = engine
+        self._endpoint = f"/api/v1/orgs/{org_id}/inventory"
+        self._max_batch = max_batch
+        self._max_wait = max_wait_ms / 1000
+        self._queue: asyncio.Queue[tuple[str, asyncio.Future] | None] = asyncio.Queue()
+        self._task: asyncio.Task | None = None
+        self._stopping = False
+
+    async def claim(self, claim_code: str) -> dict:
+        """
+        Queue a claim code and wait for the batch it lands in.
+
+        Args:
+            claim_code: Device activation/claim code
+
+        Returns:
+            Dict with claim_code, status (added, duplicated, error),
+            serial when Mist reports it, and reason for errors
+
+        Raises:
+            HTTPException: If the bulk Mist API call fails or returns
+                an unexpected payload
+            RuntimeError: If the buffer is already stopping
+        """
+        if self._stopping:
+            raise RuntimeError("ClaimBuffer is stopped; no new claims accepted")
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((claim_code, future))
+        return await future
+
+    def start(self) -> None:
+        """Start the background flush task."""
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Flush any pending claims and stop the background task."""
+        self._stopping = True
+        await self._queue.put(None)
+        if self._task is not None:
+            await self._task
+
+    async def _run(self) -> None:
+        """Collect queued claims into batches until stopped."""
+        loop = asyncio.get_running_loop()
+        stopping = False
+        try:
+            while not stopping:
+                item = await self._queue.get()
+                if item is None:
+                    break
+                batch = [item]
+                deadline = loop.time() + self._max_wait
+                while len(batch) < self._max_batch:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(self._queue.get(), remaining)
+                    except TimeoutError:
+                        break
+                    if item is None:
+                        stopping = True
+                        break
+                    batch.append(item)
+                await self._flush(batch)
+        finally:
+            # Never leave a caller awaiting a claim that will not be sent
+            self._stopping = True
+            while not self._queue.empty():
+                item = self._queue.get_nowait()
+                if item is not None and not item[1].done():
+                    item[1].set_exception(
+                        HTTPException(status_code=503, detail="Claim buffer stopped before sending claim")
+                    )
+
+    async def _flush(self, batch: list[tuple[str, asyncio.Future]]) -> None:
+        """Send one bulk claim and resolve each caller's future."""
+        codes = [code for code, _ in batch]
+        try:
+            result = await self._engine.post(self._endpoint, json=codes)
+            outcomes = self._map_outcomes(codes, result)
+        except Exception as e:  # noqa: BLE001 - every waiting caller must see the failure
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for code, future in batch:
+            if not future.done():
+                future.set_result(outcomes[code])
+
+    @staticmethod
+    def _map_outcomes(codes: list[str], result: dict) -> dict[str, dict]:
+        """
+        Map a Mist bulk claim response to a per-claim-code outcome.
+
+        Raises:
+            HTTPException: If the response is not the expected claim payload
+        """
+        try:
+            added = set(result.get("added", []))
+            duplicated = set(result.get("duplicated", []))
+            reasons = dict(zip(result.get("error", []), result.get("reason", [])))
+            serials = {
+                d.get("magic"): d.get("serial")
+                for d in [*result.get("inventory_added", []), *result.get("inventory_duplicated", [])]
+            }
+        except (AttributeError, TypeError) as e:
+            raise HTTPException(
+                status_code=502,
+                detail=f"Unexpected Mist API claim response: {e}"
+            )
+
+        outcomes = {}
+        for code in codes:
+            if code in added:
+                status = "added"
+            elif code in duplicated:
+                status = "duplicated"
+            else:
+                status = "error"
+            outcome = {"claim_code": code, "status": status, "serial": serials.get(code)}
+            if status == "error":
+                outcome["reason"] = reasons.get(code, "Not claimed by Mist API")
+            outcomes[code] = outcome
+        return outcomes
+
 
 class MistEngine:
     """
@@ -23,30 +223,16 @@ class MistEngine:
             host: Mist API host (e.g., api.mist.com)
             timeout: Request timeout in seconds
         """
-        settings = get_settings()
         self.base_url = f"https://{host}"
-        self.api_key = settings.mist_api_key
         self.timeout = timeout
-        self.headers = {
-            "Authorization": f"Token {self.api_key}",
-            "Content-Type": "application/json"
-        }
+        self._client = get_mist_client()
 
-    async def _request(
-        self,
-        method: str,
-        endpoint: str,
-        json: dict | None = None,
-        params: dict | None = None
-    ) -> dict:
+    async def _send(self, request: Awaitable[httpx.Response]) -> dict:
         """
-        Execute an API request with error handling.
+        Await a client call and decode its response with error handling.
 
         Args:
-            method: HTTP method (GET, POST, PUT, DELETE)
-            endpoint: API endpoint (e.g., /api/v1/self)
-            json: Request body for POST/PUT
-            params: Query parameters
+            request: Un-awaited httpx client call (e.g. self._client.get(...))
 
         Returns:
             API response as dict
@@ -54,51 +240,98 @@ class MistEngine:
         Raises:
             HTTPException: On API or connection errors
         """
-        url = f"{self.base_url}{endpoint}"
-
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                response = await client.request(
-                    method=method,
-                    url=url,
-                    headers=self.headers,
-                    json=json,
-                    params=params
-                )
-                response.raise_for_status()
-                return response.json()
-
-            except httpx.TimeoutException:
-                raise HTTPException(
-                    status_code=504,
-                    detail="Request to Mist API timed out"
-                )
-            except httpx.HTTPStatusError as e:
-                raise HTTPException(
-                    status_code=e.response.status_code,
-                    detail=f"Mist API error: {e.response.text}"
-                )
-            except httpx.RequestError as e:
-                raise HTTPException(
-                    status_code=502,
-                    detail=f"Failed to connect to Mist API: {str(e)}"
-                )
+        try:
+            response = await request
+            response.raise_for_status()
+            return orjson.loads(response.content)
+
+        except httpx.TimeoutException:
+            raise HTTPException(
+                status_code=504,
+                detail="Request to Mist API timed out"
+            )
+        except httpx.HTTPStatusError as e:
+            raise HTTPException(
+                status_code=e.response.status_code,
+                detail=f"Mist API error: {e.response.text}"
+            )
+        except httpx.RequestError as e:
+            raise HTTPException(
+                status_code=502,
+                detail=f"Failed to connect to Mist API: {str(e)}"
+            )
 
     async def get(self, endpoint: str, params: dict | None = None) -> dict:
         """Execute a GET request."""
-        return await self._request("GET", endpoint, params=params)
+        return await self._send(
+            self._client.get(f"{self.base_url}{endpoint}", params=params, timeout=self.timeout)
+        )
 
-    async def post(self, endpoint: str, json: dict | None = None) -> dict:
+    async def post(self, endpoint: str, json: dict | list | None = None) -> dict:
         """Execute a POST request."""
-        return await self._request("POST", endpoint, json=json)
+        return await self._send(
+            self._client.post(f"{self.base_url}{endpoint}", json=json, timeout=self.timeout)
+        )
 
-    async def put(self, endpoint: str, json: dict | None = None) -> dict:
+    async def put(self, endpoint: str, json: dict | list | None = None) -> dict:
         """Execute a PUT request."""
-        return await self._request("PUT", endpoint, json=json)
+        return await self._send(
+            self._client.put(f"{self.base_url}{endpoint}", json=json, timeout=self.timeout)
+        )
 
     async def delete(self, endpoint: str) -> dict:
         """Execute a DELETE request."""
-        return await self._request("DELETE", endpoint)
+        return await self._send(
+            self._client.delete(f"{self.base_url}{endpoint}", timeout=self.timeout)
+        )
+
+    async def gather(self, *aws: Awaitable, limit: int = 20) -> list:
+        """
+        Run Mist API calls concurrently with a cap on requests in flight.
+
+        Args:
+            aws: Un-awaited calls, e.g. engine.post(...) coroutines
+            limit: Maximum concurrent requests, to stay under Mist rate limits
+
+        Returns:
+            Result or raised exception for each call, in input order
+        """
+        semaphore = asyncio.Semaphore(limit)
+
+        async def bounded(aw: Awaitable):
+            async with semaphore:
+                return await aw
+
+        return await asyncio.gather(*(bounded(aw) for aw in aws), return_exceptions=True)
+
+    @asynccontextmanager
+    async def buffered_claim(
+        self,
+        org_id: str,
+        max_batch: int = 100,
+        max_wait_ms: float = 50
+    ) -> AsyncIterator[ClaimBuffer]:
+        """
+        Batch concurrent device claims into bulk inventory calls.
+
+        Usage:
+            async with engine.buffered_claim(org_id) as buffer:
+                results = await asyncio.gather(*(buffer.claim(c) for c in codes))
+
+        Args:
+            org_id: Organization that will own the claimed devices
+            max_batch: Flush once this many claim codes are pending
+            max_wait_ms: Flush this long after the first pending claim code
+
+        Yields:
+            ClaimBuffer accepting individual claim codes
+        """
+        buffer = ClaimBuffer(self, org_id, max_batch=max_batch, max_wait_ms=max_wait_ms)
+        buffer.start()
+        try:
+            yield buffer
+        finally:
+            await buffer.stop()
 
     # =========================================================================
     # Convenience Methods
@@ -5,11 +5,19 @@ Algorithmic IP Planning - No Spreadsheets Required
 This service mathematically generates non-overlapping subnets for every site 
 based on its Zone ID, eliminating manual IP management.
 """
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import cache
 from ipaddress import IPv4Network
-from pydantic import BaseModel
 
+# Highest zone with a valid, non-overlapping plan: the IoT block sits at
+# second octet 220 + zone_id, and zone 21's guest block (10.221.x) would
+# collide with zone 1's IoT block.
+MAX_ZONE_ID = 20
 
-class IPAllocation(BaseModel):
+
+@dataclass(frozen=True, slots=True)
+class IPAllocation:
     """IP allocation result for a site."""
     zone_id: int
     site_id: int
@@ -20,6 +28,52 @@ class IPAllocation(BaseModel):
     iot_subnet: str
 
 
+@dataclass(frozen=True, slots=True)
+class ZoneSummary:
+    """IP range summary for a zone."""
+    zone_id: int
+    management_range: str
+    data_range: str
+    voice_range: str
+    guest_range: str
+    iot_range: str
+    max_sites: int = 255
+
+
+# =============================================================================
+# Allocation Tables
+# =============================================================================
+# zone_id is bounded 1-MAX_ZONE_ID and site_id 1-255, so there are only
+# 5,100 possible site allocations and 20 zone summaries. Results are
+# memoized and shared, which is why both result types are frozen.
+
+@cache
+def _alloc(zone_id: int, site_id: int) -> IPAllocation:
+    """Build the allocation for a range-checked (zone_id, site_id) pair."""
+    return IPAllocation(
+        zone_id=zone_id,
+        site_id=site_id,
+        management_subnet=f"10.{zone_id}.{site_id}.0/24",
+        data_subnet=f"10.{100 + zone_id}.{site_id}.0/24",
+        voice_subnet=f"10.{150 + zone_id}.{site_id}.0/24",
+        guest_subnet=f"10.{200 + zone_id}.{site_id}.0/24",
+        iot_subnet=f"10.{220 + zone_id}.{site_id}.0/24"
+    )
+
+
+@cache
+def _zone_summary(zone_id: int) -> ZoneSummary:
+    """Build the IP range summary for a zone."""
+    return ZoneSummary(
+        zone_id=zone_id,
+        management_range=f"10.{zone_id}.0.0/16",
+        data_range=f"10.{100 + zone_id}.0.0/16",
+        voice_range=f"10.{150 + zone_id}.0.0/16",
+        guest_range=f"10.{200 + zone_id}.0.0/16",
+        iot_range=f"10.{220 + zone_id}.0.0/16"
+    )
+
+
 class NetworkCalculator:
     """
     Algorithmic IP Planning Service.
@@ -43,46 +97,64 @@ class NetworkCalculator:
                              -> 10.201.55.0/24 (Voice)
         
         Args:
-            zone_id: Zone identifier (1-255)
+            zone_id: Zone identifier (1-MAX_ZONE_ID)
             site_id: Site identifier within zone (1-255)
         
         Returns:
             IPAllocation with all subnet assignments
         """
-        if not 1 <= zone_id <= 255:
-            raise ValueError(f"Zone ID must be 1-255, got {zone_id}")
+        if not 1 <= zone_id <= MAX_ZONE_ID:
+            raise ValueError(f"Zone ID must be 1-{MAX_ZONE_ID}, got {zone_id}")
         if not 1 <= site_id <= 255:
             raise ValueError(f"Site ID must be 1-255, got {site_id}")
         
-        return IPAllocation(
-            zone_id=zone_id,
-            site_id=site_id,
-            management_subnet=f"10.{zone_id}.{site_id}.0/24",
-            data_subnet=f"10.{100 + zone_id}.{site_id}.0/24",
-            voice_subnet=f"10.{150 + zone_id}.{site_id}.0/24",
-            guest_subnet=f"10.{200 + zone_id}.{site_id}.0/24",
-            iot_subnet=f"10.{220 + zone_id}.{site_id}.0/24"
-        )
+        return _alloc(zone_id, site_id)
     
-    def calculate_zone_summary(self, zone_id: int) -> dict:
+    def calculate_all_site_subnets(
+        self,
+        zone_ids: Sequence[int],
+        site_ids: Sequence[int]
+    ) -> list[IPAllocation]:
+        """
+        Calculate IP subnets for many (zone, site) pairs in one pass.
+        
+        Inputs are range-checked once up front; each pair is then a
+        lookup in the memoized allocation table.
+        
+        Args:
+            zone_ids: Zone identifier for each site (1-MAX_ZONE_ID)
+            site_ids: Site identifier within zone for each site (1-255)
+        
+        Returns:
+            IPAllocation per (zone_id, site_id) pair, in input order
+        """
+        if len(zone_ids) != len(site_ids):
+            raise ValueError(
+                f"zone_ids and site_ids must be the same length, got {len(zone_ids)} and {len(site_ids)}"
+            )
+        if not zone_ids:
+            return []
+        if not (1 <= min(zone_ids) and max(zone_ids) <= MAX_ZONE_ID):
+            raise ValueError(f"Zone IDs must be 1-{MAX_ZONE_ID}")
+        if not (1 <= min(site_ids) and max(site_ids) <= 255):
+            raise ValueError("Site IDs must be 1-255")
+        
+        return [_alloc(zone_id, site_id) for zone_id, site_id in zip(zone_ids, site_ids)]
+    
+    def calculate_zone_summary(self, zone_id: int) -> ZoneSummary:
         """
         Get summary of IP ranges for an entire zone.
         
         Args:
-            zone_id: Zone identifier
+            zone_id: Zone identifier (1-MAX_ZONE_ID)
         
         Returns:
-            Dictionary with zone IP range summaries
+            ZoneSummary with zone IP range summaries
         """
-        return {
-            "zone_id": zone_id,
-            "management_range": f"10.{zone_id}.0.0/16",
-            "data_range": f"10.{100 + zone_id}.0.0/16",
-            "voice_range": f"10.{150 + zone_id}.0.0/16",
-            "guest_range": f"10.{200 + zone_id}.0.0/16",
-            "iot_range": f"10.{220 + zone_id}.0.0/16",
-            "max_sites": 255
-        }
+        if not 1 <= zone_id <= MAX_ZONE_ID:
+            raise ValueError(f"Zone ID must be 1-{MAX_ZONE_ID}, got {zone_id}")
+        
+        return _zone_summary(zone_id)
 
 
 # Singleton instance
@@ -1,4 +1,5 @@
-import redis
+import redis.asyncio as redis
+from redis.exceptions import WatchError
 from src.config import get_settings
 
 
@@ -13,55 +14,154 @@ class RedisKeys:
 
 
 class RedisClient:
+    # One pool is shared by every request in the worker. A blocking pool
+    # makes callers wait for a free connection under a burst instead of
+    # failing with "Too many connections".
+    MAX_CONNECTIONS = 100
+    POOL_TIMEOUT_SECONDS = 5
+
     def __init__(self):
         settings = get_settings()
         url = settings.redis_url
-        self.client = redis.Redis.from_url(url, decode_responses=True)
-
-    def set(self, key: str, value: str, expire: int = None) -> bool:
+        pool = redis.BlockingConnectionPool.from_url(
+            url,
+            max_connections=self.MAX_CONNECTIONS,
+            timeout=self.POOL_TIMEOUT_SECONDS,
+            decode_responses=True,
+        )
+        self.client = redis.Redis(connection_pool=pool)
+
+    async def set(self, key: str, value: str, expire: int = None) -> bool:
         """Set a key-value pair in Redis."""
-        return self.client.setex(key, expire, value) if expire else self.client.set(key, value)
+        return await (self.client.setex(key, expire, value) if expire else self.client.set(key, value))
 
-    def get(self, key: str) -> str | None:
+    async def get(self, key: str) -> str | None:
         """Get a value by key from Redis."""
-        return self.client.get(key)
+        return await self.client.get(key)
 
-    def delete(self, key: str) -> int:
-        """Delete a key from Redis."""
-        return self.client.delete(key)
+    async def get_many(self, *keys: str) -> list[str | None]:
+        """Get several values from Redis in one round trip."""
+        return await self.client.mget(keys)
+
+    async def set_many(self, mapping: dict[str, str]) -> bool:
+        """Set several key-value pairs atomically in one round trip."""
+        return await self.client.mset(mapping)
 
-    def ping(self) -> bool:
+    async def delete(self, key: str) -> int:
+        """Delete a key from Redis."""
+        return await self.client.delete(key)
+
+    async def set_indexed(
+        self, key: str, value: str, expire: int, index: str, version_key: str, version: str | None
+    ) -> bool:
+        """
+        Set a key with a TTL and record it in an index set, unless the
+        version key has moved on from `version`.
+
+        The version check and the writes run as one WATCH/MULTI
+        transaction, so a concurrent `incr` of the version key always
+        wins over a store started before it.
+
+        Returns:
+            True if the value was stored, False if the version changed
+        """
+        async with self.client.pipeline(transaction=True) as pipe:
+            await pipe.watch(version_key)
+            if await pipe.get(version_key) != version:
+                return False
+            pipe.multi()
+            pipe.set(key, value, ex=expire)
+            pipe.sadd(index, key)
+            # The index must outlive its longest-lived member
+            pipe.expire(index, expire, nx=True)
+            pipe.expire(index, expire, gt=True)
+            try:
+                await pipe.execute()
+            except WatchError:
+                return False
+        return True
+
+    async def delete_indexed(self, index: str) -> int:
+        """Delete every key recorded in an index set and drop them from the set."""
+        keys = await self.client.smembers(index)
+        if not keys:
+            return 0
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.unlink(*keys)
+            # SREM rather than DEL, so a key indexed since SMEMBERS stays tracked
+            pipe.srem(index, *keys)
+            results = await pipe.execute()
+        return results[0]
+
+    async def incr(self, key: str) -> int:
+        """Increment a counter key."""
+        return await self.client.incr(key)
+
+    async def ping(self) -> bool:
         """Test Redis connection."""
         try:
-            return self.client.ping()
+            return await self.client.ping()
         except redis.ConnectionError:
             return False
 
+    async def close(self) -> None:
+        """Close the connection pool."""
+        await self.client.aclose()
+
+
+# Shared instance so every request draws from one connection pool.
+_redis_client: RedisClient | None = None
+
 
 def get_redis_client() -> RedisClient:
-    """Get a Redis client instance."""
-    return RedisClient()
+    """Get the shared Redis client instance."""
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = RedisClient()
+    return _redis_client
+
+
+async def close_redis_client() -> None:
+    """Close the shared Redis client and release its connections."""
+    global _redis_client
+    if _redis_client is not None:
+        await _redis_client.close()
+        _redis_client = None
 
 
 # =============================================================================
 # Context Accessors
 # =============================================================================
 
-def get_api_host() -> str | None:
+async def get_api_host() -> str | None:
     """Get the stored API host."""
-    return get_redis_client().get(RedisKeys.API_HOST)
+    return await get_redis_client().get(RedisKeys.API_HOST)
 
 
-def get_org_id() -> str | None:
+async def get_org_id() -> str | None:
     """Get the stored organization ID."""
-    return get_redis_client().get(RedisKeys.ORG_ID)
+    return await get_redis_client().get(RedisKeys.ORG_ID)
+
 
+async def get_org_context() -> tuple[str | None, str | None]:
+    """Get the stored API host and organization ID in one round trip."""
+    api_host, org_id = await get_redis_client().get_many(RedisKeys.API_HOST, RedisKeys.ORG_ID)
+    return api_host, org_id
 
-def set_api_host(value: str) -> bool:
+
+async def set_api_host(value: str) -> bool:
     """Store the API host."""
-    return get_redis_client().set(RedisKeys.API_HOST, value)
+    return await get_redis_client().set(RedisKeys.API_HOST, value)
 
 
-def set_org_id(value: str) -> bool:
+async def set_org_id(value: str) -> bool:
     """Store the organization ID."""
-    return get_redis_client().set(RedisKeys.ORG_ID, value)
+    return await get_redis_client().set(RedisKeys.ORG_ID, value)
+
+
+async def set_org_context(api_host: str, org_id: str | None = None) -> bool:
+    """Store the API host and, if given, the organization ID in one round trip."""
+    mapping = {RedisKeys.API_HOST: api_host}
+    if org_id:
+        mapping[RedisKeys.ORG_ID] = org_id
+    return await get_redis_client().set_many(mapping)
@@ -0,0 +1,202 @@
+"""
+Tests for the Response Cache.
+
+These tests validate that polled GET endpoints are served from Redis
+within their TTL and that a Redis outage degrades to uncached reads.
+
+All tests mock Redis and the Mist API to avoid external dependencies.
+"""
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+from redis.exceptions import ConnectionError
+
+from src.main import app
+from src.services.cache import invalidate_cache
+from src.services.redis import RedisClient
+
+
+class TestResponseCache:
+    """
+    Test caching on GET /sites/{site_id}.
+
+    Why: Dashboards poll site state every second. Without a cache every
+    poll becomes a Mist API call and counts against the org rate limit.
+    """
+
+    @pytest.fixture
+    def client(self):
+        """Create FastAPI test client."""
+        return TestClient(app)
+
+    @pytest.fixture
+    def mock_redis(self):
+        """Mock the shared Redis client used by the cache."""
+        with patch("src.services.cache.get_redis_client") as mock:
+            redis_mock = AsyncMock()
+            mock.return_value = redis_mock
+            yield redis_mock
+
+    @pytest.fixture
+    def mock_mist(self):
+        """Mock the org context and the Mist API call."""
+        with patch("src.routers.day0_design_and_topology.sites.get_api_host", AsyncMock(return_value="api.mist.com")), \
+                patch("src.routers.day0_design_and_topology.sites.MistEngine") as engine:
+            engine.return_value.get = AsyncMock(return_value={"id": "site-1", "name": "Branch-Austin-001"})
+            yield engine.return_value.get
+
+    def test_cache_miss_stores_response(self, client, mock_redis, mock_mist):
+        """
+        Test: A miss calls Mist and stores the response with a TTL.
+
+        Why: The first poll must populate the cache for the ones after it.
+        """
+        # Arrange: Nothing cached yet
+        mock_redis.get_many.return_value = [None, "3"]
+
+        # Act
+        response = client.get("/sites/site-1")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["name"] == "Branch-Austin-001"
+        mock_mist.assert_awaited_once()
+        key, payload, ttl, index, version_key, version = mock_redis.set_indexed.await_args.args
+        assert key.startswith("cache:sites:get_site:")
+        assert orjson.loads(payload)["id"] == "site-1"
+        assert ttl == 5
+        assert index == "cache:sites:index"
+        assert (version_key, version) == ("cache:sites:generation", "3")
+
+    def test_cache_hit_skips_mist(self, client, mock_redis, mock_mist):
+        """
+        Test: A hit is served from Redis without calling Mist.
+
+        Why: This is the whole point of the cache - polls inside the TTL
+        must not reach the Mist API.
+        """
+        # Arrange: Response already cached
+        mock_redis.get_many.return_value = [orjson.dumps({"id": "site-1", "name": "Cached-Site"}).decode(), "3"]
+
+        # Act
+        response = client.get("/sites/site-1")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["name"] == "Cached-Site"
+        mock_mist.assert_not_awaited()
+
+    def test_redis_outage_falls_through(self, client, mock_redis, mock_mist):
+        """
+        Test: A Redis error is treated as a miss, not a failure.
+
+        Why: Losing the cache should slow reads down, not take them down.
+        """
+        # Arrange: Redis unreachable
+        mock_redis.get_many.side_effect = ConnectionError("redis down")
+        mock_redis.set_indexed.side_effect = ConnectionError("redis down")
+
+        # Act
+        response = client.get("/sites/site-1")
+
+        # Assert
+        assert response.status_code == 200
+        mock_mist.assert_awaited_once()
+
+
+class TestCacheInvalidation:
+    """
+    Test cache invalidation after writes.
+
+    Why: A stale cached read after a write shows operators a site or
+    device assignment that no longer exists in Mist.
+    """
+
+    @pytest.fixture
+    def mock_redis(self):
+        """Mock the shared Redis client used by the cache."""
+        with patch("src.services.cache.get_redis_client") as mock:
+            redis_mock = AsyncMock()
+            mock.return_value = redis_mock
+            yield redis_mock
+
+    def test_invalidate_namespace_uses_index(self, mock_redis):
+        """
+        Test: Invalidating a namespace deletes only its indexed keys.
+
+        Why: Scanning the whole keyspace on every write makes writes
+        slower as unrelated keys accumulate.
+        """
+        # Act
+        asyncio.run(invalidate_cache("sites"))
+
+        # Assert: Generation bumped first, so in-flight reads skip their store
+        mock_redis.incr.assert_awaited_once_with("cache:sites:generation")
+        mock_redis.delete_indexed.assert_awaited_once_with("cache:sites:index")
+
+    def test_invalidate_all_namespaces(self, mock_redis):
+        """
+        Test: A full invalidation clears every registered namespace.
+
+        Why: Switching orgs makes every cached response belong to the
+        wrong org.
+        """
+        # Act
+        asyncio.run(invalidate_cache())
+
+        # Assert
+        indexes = {c.args[0] for c in mock_redis.delete_indexed.await_args_list}
+        assert {"cache:sites:index", "cache:inventory:index"} <= indexes
+
+    def test_delete_site_invalidates_inventory(self):
+        """
+        Test: Deleting a site also clears cached inventory.
+
+        Why: Deleting a site unassigns its devices, so cached inventory
+        would keep showing the old site_id.
+        """
+        # Arrange
+        with patch("src.routers.day0_design_and_topology.sites.get_api_host", AsyncMock(return_value="api.mist.com")), \
+                patch("src.routers.day0_design_and_topology.sites.MistEngine") as engine, \
+                patch("src.routers.day0_design_and_topology.sites.invalidate_cache", AsyncMock()) as invalidate:
+            engine.return_value.delete = AsyncMock(return_value={})
+
+            # Act
+            response = TestClient(app).delete("/sites/site-1")
+
+        # Assert
+        assert response.status_code == 200
+        assert {c.args[0] for c in invalidate.await_args_list} == {"sites", "inventory"}
+
+    def test_invalidation_during_fetch_skips_store(self):
+        """
+        Test: A read that misses, then races a write's invalidation, is not cached.
+
+        Why: The read fetched pre-write data. Storing it after the write
+        invalidated the namespace would serve the old site for a full TTL.
+        """
+        # Arrange: A real RedisClient on an in-memory Redis
+        fakeredis = pytest.importorskip("fakeredis")
+        redis_client = RedisClient.__new__(RedisClient)
+        redis_client.client = fakeredis.FakeAsyncRedis(decode_responses=True)
+
+        async def fetch_racing_write(*args, **kwargs) -> dict:
+            # The write lands after the read's miss but before its store
+            await invalidate_cache("sites")
+            return {"id": "site-1", "name": "Pre-Write-Name"}
+
+        with patch("src.services.cache.get_redis_client", return_value=redis_client), \
+                patch("src.routers.day0_design_and_topology.sites.get_api_host", AsyncMock(return_value="api.mist.com")), \
+                patch("src.routers.day0_design_and_topology.sites.MistEngine") as engine:
+            engine.return_value.get = AsyncMock(side_effect=fetch_racing_write)
+
+            # Act
+            response = TestClient(app).get("/sites/site-1")
+            cached_keys = asyncio.run(redis_client.client.keys("cache:sites:get_site:*"))
+
+        # Assert: Served, but nothing cached for the next poll
+        assert response.status_code == 200
+        assert cached_keys == []
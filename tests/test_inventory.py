@@ -0,0 +1,87 @@
+"""
+Tests for the Inventory Router.
+
+These tests validate how Mist inventory pages are turned into the
+GET /inventory/ response.
+
+All tests mock the org context, the response cache and the Mist API.
+"""
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.main import app
+from src.routers.day0_design_and_topology.inventory import DeviceType, list_inventory
+
+
+class TestListInventory:
+    """
+    Test the GET /inventory/ endpoint.
+
+    Why: Mist inventory entries vary by device type and claim state. One
+    odd entry must not fail the page, and Mist-only fields must not leak
+    into our schema.
+    """
+
+    @pytest.fixture
+    def mock_mist(self):
+        """Mock the org context, a cold cache and the Mist inventory call."""
+        # One AP with extra Mist fields, one unclaimed switch with no serial yet
+        page = [
+            {
+                "serial": "A0001",
+                "mac": "5c5b35000001",
+                "model": "AP45",
+                "type": "ap",
+                "site_id": "site-1",
+                "connected": True,
+                "hw_rev": "B",
+                "deviceprofile_id": "dp-1",
+            },
+            {"mac": "5c5b35000002", "model": "EX4100-48P", "type": "switch"},
+        ]
+        with patch("src.routers.day0_design_and_topology.inventory.get_org_context",
+                   AsyncMock(return_value=("api.mist.com", "org-1"))), \
+                patch("src.services.cache.get_redis_client") as redis, \
+                patch("src.routers.day0_design_and_topology.inventory.MistEngine") as engine:
+            redis.return_value = AsyncMock()
+            redis.return_value.get_many.return_value = [None, None]
+            engine.return_value.get = AsyncMock(return_value=page)
+            yield engine.return_value.get
+
+    def test_page_response(self, mock_mist):
+        """
+        Test: Missing serials fall back to "" and extra Mist fields are dropped.
+
+        Why: Unclaimed devices can lack a serial; rejecting them would
+        hide the rest of the page from the operator.
+        """
+        # Act
+        response = TestClient(app).get("/inventory/", params={"limit": 2})
+
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert data["count"] == 2
+        assert data["devices"][0]["serial"] == "A0001"
+        assert data["devices"][1]["serial"] == ""
+        assert "hw_rev" not in data["devices"][0]
+        assert "deviceprofile_id" not in data["devices"][0]
+
+    def test_type_parsed_as_enum(self, mock_mist):
+        """
+        Test: Device types are parsed into DeviceType members.
+
+        Why: Callers pass device.type back into Mist filters via `.value`;
+        a bare string has no `.value`.
+        """
+        # Act
+        result = asyncio.run(list_inventory(type=None, unassigned=False, limit=100, page=1))
+
+        # Assert
+        assert result.devices[0].type is DeviceType.AP
+        assert result.devices[1].type is DeviceType.SWITCH
+        assert result.devices[0].connected is True
+        assert result.devices[1].connected is False
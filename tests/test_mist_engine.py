@@ -0,0 +1,222 @@
+"""
+Tests for the Mist API Engine.
+
+These tests validate the shared HTTP client and the error mapping that
+every router relies on when calling the Mist Cloud.
+
+All tests mock the HTTP transport to avoid real Mist API calls.
+"""
+import asyncio
+
+import httpx
+import pytest
+from fastapi import HTTPException
+
+from src.services import mist_engine
+from src.services.mist_engine import MistEngine, get_mist_client
+
+
+class TestMistEngine:
+    """
+    Test the MistEngine request path.
+
+    Why: Every Day 0/1/2 router goes through MistEngine. A broken client
+    or a wrong status mapping surfaces as failed provisioning at every site.
+    """
+
+    @pytest.fixture
+    def mock_transport(self, monkeypatch):
+        """
+        Install a shared client backed by a mock transport.
+
+        Why: Tests should never hit the Mist Cloud. The handler records
+        each request so tests can assert on what was sent.
+        """
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if "missing" in request.url.path:
+                return httpx.Response(404, text="not found")
+            if request.url.path == "/api/v1/orgs/org-1/inventory":
+                return httpx.Response(200, json={
+                    "added": ["CODE-A"],
+                    "duplicated": ["CODE-B"],
+                    "error": ["CODE-C"],
+                    "reason": ["invalid claim code"],
+                    "inventory_added": [{"magic": "CODE-A", "serial": "A0001"}],
+                    "inventory_duplicated": [{"magic": "CODE-B", "serial": "B0001"}],
+                })
+            if request.url.path == "/api/v1/orgs/malformed/inventory":
+                return httpx.Response(200, json=[])
+            return httpx.Response(200, json={"name": "lab"})
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(mist_engine, "_client", client)
+        yield requests
+
+    def test_engines_share_client(self, mock_transport):
+        """
+        Test: Every engine reuses the process-wide client.
+
+        Why: A new client per request pays a TCP + TLS handshake to the
+        Mist Cloud on every call.
+        """
+        # Arrange / Act
+        first = MistEngine(host="api.mist.com")
+        second = MistEngine(host="api.eu.mist.com")
+
+        # Assert
+        assert first._client is second._client
+        assert first._client is get_mist_client()
+
+    def test_get_builds_host_url(self, mock_transport):
+        """
+        Test: Requests are sent to the engine's regional host.
+
+        Why: Orgs live in a single regional cloud; calling the wrong
+        host returns 404s for valid objects.
+        """
+        # Arrange
+        engine = MistEngine(host="api.eu.mist.com")
+
+        # Act
+        result = asyncio.run(engine.get("/api/v1/self", params={"limit": 1}))
+
+        # Assert
+        assert result == {"name": "lab"}
+        assert str(mock_transport[0].url) == "https://api.eu.mist.com/api/v1/self?limit=1"
+
+    def test_http_error_maps_status(self, mock_transport):
+        """
+        Test: Mist API errors surface as HTTPException with the same status.
+
+        Why: Callers must see the real Mist status (e.g. 404) rather than
+        a generic 500 to decide whether to retry.
+        """
+        # Arrange
+        engine = MistEngine(host="api.mist.com")
+
+        # Act
+        with pytest.raises(HTTPException) as exc:
+            asyncio.run(engine.get("/api/v1/missing"))
+
+        # Assert
+        assert exc.value.status_code == 404
+
+    def test_buffered_claim_coalesces_requests(self, mock_transport):
+        """
+        Test: Concurrent claims are sent as one bulk inventory call.
+
+        Why: Claiming a pallet of devices one code at a time multiplies
+        Mist API calls and burns the org's rate limit.
+        """
+        # Arrange
+        engine = MistEngine(host="api.mist.com")
+
+        async def claim_all() -> list[dict]:
+            async with engine.buffered_claim("org-1") as buffer:
+                return await asyncio.gather(
+                    *(buffer.claim(code) for code in ["CODE-A", "CODE-B", "CODE-C"])
+                )
+
+        # Act
+        results = asyncio.run(claim_all())
+
+        # Assert: One POST carrying every claim code
+        assert len(mock_transport) == 1
+        assert mock_transport[0].method == "POST"
+        assert mock_transport[0].read() == b'["CODE-A","CODE-B","CODE-C"]'
+
+        # Assert: Each caller receives its own outcome
+        assert results[0] == {"claim_code": "CODE-A", "status": "added", "serial": "A0001"}
+        assert results[1]["status"] == "duplicated"
+        assert results[2]["status"] == "error"
+        assert results[2]["reason"] == "invalid claim code"
+
+    def test_buffered_claim_propagates_api_error(self, mock_transport):
+        """
+        Test: A failed bulk call fails every claim in the batch.
+
+        Why: Callers must not wait forever or assume success when
+        the Mist API rejects the whole request.
+        """
+        # Arrange
+        engine = MistEngine(host="api.mist.com")
+
+        async def claim_one() -> dict:
+            async with engine.buffered_claim("missing-org") as buffer:
+                return await buffer.claim("CODE-A")
+
+        # Act / Assert
+        with pytest.raises(HTTPException):
+            asyncio.run(claim_one())
+
+    def test_buffered_claim_rejects_unexpected_payload(self, mock_transport):
+        """
+        Test: An unexpected bulk claim payload fails the claim with a 502.
+
+        Why: If Mist changes the response shape, callers must get an
+        error instead of hanging on a claim that never resolves.
+        """
+        # Arrange
+        engine = MistEngine(host="api.mist.com")
+
+        async def claim_one() -> dict:
+            async with engine.buffered_claim("malformed") as buffer:
+                return await asyncio.wait_for(buffer.claim("CODE-A"), timeout=2)
+
+        # Act
+        with pytest.raises(HTTPException) as exc:
+            asyncio.run(claim_one())
+
+        # Assert
+        assert exc.value.status_code == 502
+
+    def test_buffered_claim_rejects_after_stop(self, mock_transport):
+        """
+        Test: Claims queued after the buffer stops are refused.
+
+        Why: No flush task is left to send them, so waiting would hang.
+        """
+        # Arrange
+        engine = MistEngine(host="api.mist.com")
+
+        async def claim_late() -> dict:
+            async with engine.buffered_claim("org-1") as buffer:
+                pass
+            return await asyncio.wait_for(buffer.claim("CODE-A"), timeout=2)
+
+        # Act / Assert
+        with pytest.raises(RuntimeError):
+            asyncio.run(claim_late())
+
+    def test_gather_caps_in_flight_requests(self, mock_transport):
+        """
+        Test: gather runs calls concurrently but never beyond the limit.
+
+        Why: Bulk site creation must be fast without tripping the Mist
+        API rate limit and failing half the sites.
+        """
+        # Arrange
+        engine = MistEngine(host="api.mist.com")
+        in_flight, peak = 0, 0
+
+        async def call(i: int) -> int:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if i == 3:
+                raise HTTPException(status_code=400, detail="duplicate site name")
+            return i
+
+        # Act
+        results = asyncio.run(engine.gather(*(call(i) for i in range(10)), limit=4))
+
+        # Assert: Concurrency capped, order kept, failures returned not raised
+        assert peak == 4
+        assert results[:3] == [0, 1, 2]
+        assert isinstance(results[3], HTTPException)
+        assert results[9] == 9
@@ -0,0 +1,161 @@
+"""
+Tests for the Network Calculator Service.
+
+These tests validate the algorithmic IP plan. Every site's subnets are
+derived from its zone and site IDs, so a formula change re-addresses
+every site in the fleet.
+"""
+from dataclasses import FrozenInstanceError, asdict
+from ipaddress import IPv4Network
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.main import app
+from src.services.network_calculator import MAX_ZONE_ID, NetworkCalculator
+
+
+class TestNetworkCalculator:
+    """
+    Test subnet allocation for single sites and whole zones.
+
+    Why: Overlapping or inconsistent subnets between the single-site and
+    bulk paths would cause routing conflicts once sites are deployed.
+    """
+
+    @pytest.fixture
+    def calculator(self):
+        """Create a calculator with the default 10.0.0.0/8 supernet."""
+        return NetworkCalculator()
+
+    def test_site_subnets(self, calculator):
+        """
+        Test: Zone 1, Site 55 maps to the documented subnets.
+
+        Why: Field engineers pre-stage gear using these documented
+        addresses before the site exists in Mist.
+        """
+        # Act
+        allocation = calculator.calculate_site_subnets(1, 55)
+
+        # Assert
+        assert allocation.management_subnet == "10.1.55.0/24"
+        assert allocation.data_subnet == "10.101.55.0/24"
+        assert allocation.iot_subnet == "10.221.55.0/24"
+
+    def test_site_subnets_memoized(self, calculator):
+        """
+        Test: Repeat lookups return the same shared, immutable allocation.
+
+        Why: Allocations are cached process-wide; a caller mutating one
+        would silently re-address every later lookup of that site.
+        """
+        # Act
+        first = calculator.calculate_site_subnets(2, 10)
+        second = NetworkCalculator().calculate_site_subnets(2, 10)
+
+        # Assert
+        assert first is second
+        with pytest.raises(FrozenInstanceError):
+            first.management_subnet = "192.168.0.0/24"
+
+    def test_bulk_matches_single(self, calculator):
+        """
+        Test: The bulk path returns exactly what per-site calls return.
+
+        Why: Capacity plans built in bulk must match what each site
+        is provisioned with.
+        """
+        # Arrange
+        zone_ids, site_ids = [1, 1, 7], [1, 255, 42]
+
+        # Act
+        allocations = calculator.calculate_all_site_subnets(zone_ids, site_ids)
+
+        # Assert
+        expected = [calculator.calculate_site_subnets(z, s) for z, s in zip(zone_ids, site_ids)]
+        assert [asdict(a) for a in allocations] == [asdict(e) for e in expected]
+
+    def test_bulk_rejects_out_of_range(self, calculator):
+        """
+        Test: Out-of-range IDs are rejected before any subnet is built.
+
+        Why: Site ID 0 or 256 would produce an invalid third octet.
+        """
+        # Act / Assert
+        with pytest.raises(ValueError):
+            calculator.calculate_all_site_subnets([1, 1], [1, 256])
+
+    def test_highest_zone_is_valid_and_isolated(self, calculator):
+        """
+        Test: The highest accepted zone builds valid CIDRs, and one past it is rejected.
+
+        Why: Beyond MAX_ZONE_ID the IoT octet leaves 0-255 or a zone's
+        blocks land on another zone's, giving two sites the same subnet.
+        """
+        # Act
+        top = calculator.calculate_site_subnets(MAX_ZONE_ID, 255)
+        first = calculator.calculate_site_subnets(1, 255)
+
+        # Assert: Every subnet parses, and no block is shared with zone 1
+        top_subnets = {IPv4Network(s) for s in asdict(top).values() if isinstance(s, str)}
+        first_subnets = {IPv4Network(s) for s in asdict(first).values() if isinstance(s, str)}
+        assert top.iot_subnet == "10.240.255.0/24"
+        assert not top_subnets & first_subnets
+        with pytest.raises(ValueError):
+            calculator.calculate_site_subnets(MAX_ZONE_ID + 1, 1)
+        with pytest.raises(ValueError):
+            calculator.calculate_all_site_subnets([MAX_ZONE_ID + 1], [1])
+
+    def test_zone_summary_rejects_out_of_range(self, calculator):
+        """
+        Test: Zone summaries are range-checked before the memoized lookup.
+
+        Why: Summaries are cached for the life of the process; unchecked
+        IDs would grow the cache and return invalid ranges.
+        """
+        # Act
+        summary = calculator.calculate_zone_summary(MAX_ZONE_ID)
+
+        # Assert
+        assert summary.iot_range == "10.240.0.0/16"
+        for zone_id in (0, MAX_ZONE_ID + 1):
+            with pytest.raises(ValueError):
+                calculator.calculate_zone_summary(zone_id)
+
+    def test_bulk_plan_endpoint(self):
+        """
+        Test: GET /sites/bulk-plan returns every site slot in the zone.
+
+        Why: Planning a zone should take one call, not 255.
+        """
+        # Arrange
+        client = TestClient(app)
+
+        # Act
+        response = client.get("/sites/bulk-plan", params={"zone_id": 3})
+
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert data["count"] == 255
+        assert data["allocations"][0]["management_subnet"] == "10.3.1.0/24"
+        assert data["allocations"][-1]["voice_subnet"] == "10.153.255.0/24"
+
+    def test_bulk_plan_zone_bounds(self):
+        """
+        Test: GET /sites/bulk-plan accepts MAX_ZONE_ID and rejects the zone after it.
+
+        Why: Zones past the cap return invalid or overlapping CIDRs.
+        """
+        # Arrange
+        client = TestClient(app)
+
+        # Act
+        top = client.get("/sites/bulk-plan", params={"zone_id": MAX_ZONE_ID})
+        over = client.get("/sites/bulk-plan", params={"zone_id": MAX_ZONE_ID + 1})
+
+        # Assert
+        assert top.status_code == 200
+        assert top.json()["allocations"][-1]["iot_subnet"] == "10.240.255.0/24"
+        assert over.status_code == 422
@@ -9,7 +9,7 @@ All tests mock Redis to avoid external dependencies.
 """
 import json
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, AsyncMock
 from fastapi.testclient import TestClient
 
 from src.main import app
@@ -38,7 +38,7 @@ class TestNMSProfile:
         ensures tests are fast, repeatable, and don't require Redis running.
         """
         with patch("src.routers.day0_design_and_topology.nms.get_redis_client") as mock:
-            redis_mock = MagicMock()
+            redis_mock = AsyncMock()
             mock.return_value = redis_mock
             yield redis_mock
 
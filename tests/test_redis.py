@@ -1,5 +1,15 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
 import pytest
-from src.services.redis import get_redis_client
+import redis.asyncio as redis
+
+from src.services.redis import (
+    RedisClient,
+    get_org_context,
+    get_redis_client,
+    set_org_context,
+)
 
 
 class TestRedis:
@@ -8,7 +18,42 @@ class TestRedis:
     def test_redis_ping(self):
         """Test that Redis connection is successful."""
         client = get_redis_client()
-        result = client.ping()
+        result = asyncio.run(client.ping())
         if not result:
             pytest.skip("Redis not reachable - skipping test (use local Redis or Railway public URL)")
         assert result is True
+
+    def test_pool_waits_for_free_connection(self):
+        """Test that a burst past max_connections queues instead of failing."""
+        pool = RedisClient().client.connection_pool
+
+        assert isinstance(pool, redis.BlockingConnectionPool)
+        assert pool.max_connections == RedisClient.MAX_CONNECTIONS
+        assert pool.timeout == RedisClient.POOL_TIMEOUT_SECONDS
+
+
+class TestOrgContext:
+    """Test org context accessors."""
+
+    @pytest.fixture
+    def mock_redis(self):
+        """Mock the shared Redis client."""
+        with patch("src.services.redis.get_redis_client") as mock:
+            redis_mock = AsyncMock()
+            mock.return_value = redis_mock
+            yield redis_mock
+
+    def test_get_org_context(self, mock_redis):
+        """Test that api_host and org_id are read in a single MGET."""
+        mock_redis.get_many.return_value = ["api.mist.com", "org-1"]
+
+        result = asyncio.run(get_org_context())
+
+        assert result == ("api.mist.com", "org-1")
+        mock_redis.get_many.assert_awaited_once_with("api_host", "org_id")
+
+    def test_set_org_context_without_org_id(self, mock_redis):
+        """Test that a missing org_id leaves the stored org_id untouched."""
+        asyncio.run(set_org_context("api.eu.mist.com"))
+
+        mock_redis.set_many.assert_awaited_once_with({"api_host": "api.eu.mist.com"})
@@ -0,0 +1,135 @@
+"""
+Tests for bulk site creation.
+
+These tests validate that POST /sites/bulk reports every site's outcome
+and refuses requests large enough to flood the Mist API.
+
+All tests mock the org context and the Mist API.
+"""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from src.main import app
+from src.routers.day0_design_and_topology.sites import MAX_BULK_SITES
+from src.services.mist_engine import MistEngine
+
+
+class TestBulkSites:
+    """
+    Test the /sites/bulk endpoint.
+
+    Why: A rollout creates dozens of sites in one call. One bad site must
+    not hide the outcome of the others or fail the whole response.
+    """
+
+    @pytest.fixture
+    def client(self):
+        """Create FastAPI test client."""
+        return TestClient(app)
+
+    @pytest.fixture
+    def mock_engine(self):
+        """Mock org context, cache invalidation and the Mist engine."""
+        with patch("src.routers.day0_design_and_topology.sites.get_org_context",
+                   AsyncMock(return_value=("api.mist.com", "org-1"))), \
+                patch("src.routers.day0_design_and_topology.sites.invalidate_cache", AsyncMock()), \
+                patch("src.routers.day0_design_and_topology.sites.MistEngine") as engine:
+            engine.return_value.post = MagicMock()
+            yield engine.return_value
+
+    def test_creates_each_site(self, client):
+        """
+        Test: Each site is POSTed with its own payload and mapped into the response.
+
+        Why: A payload mix-up between concurrent calls would create sites
+        with another site's address or timezone.
+        """
+        # Arrange: Only the Mist POST is mocked; the real gather runs
+        async def create(path: str, json: dict) -> dict:
+            if json["name"] == "Branch-002":
+                raise HTTPException(status_code=400, detail="duplicate name")
+            return {"id": f"id-{json['name']}", "org_id": "org-1", "extra": "dropped", **json}
+
+        sites = [
+            {"name": "Branch-001", "address": "1 Main St"},
+            {"name": "Branch-002"},
+            {"name": "Branch-003", "timezone": "America/New_York", "notes": "lab"},
+        ]
+        with patch("src.routers.day0_design_and_topology.sites.get_org_context",
+                   AsyncMock(return_value=("api.mist.com", "org-1"))), \
+                patch("src.routers.day0_design_and_topology.sites.invalidate_cache", AsyncMock()) as invalidate, \
+                patch.object(MistEngine, "post", AsyncMock(side_effect=create)) as post:
+
+            # Act
+            response = client.post("/sites/bulk", json={"sites": sites})
+
+        # Assert: One POST per site, each with its own exclude_none payload
+        payloads = {c.kwargs["json"]["name"]: c for c in post.await_args_list}
+        assert post.await_count == 3
+        assert all(c.args == ("/api/v1/orgs/org-1/sites",) for c in post.await_args_list)
+        assert payloads["Branch-001"].kwargs["json"] == {
+            "name": "Branch-001", "address": "1 Main St", "timezone": "America/Chicago", "country_code": "US",
+        }
+        assert payloads["Branch-003"].kwargs["json"] == {
+            "name": "Branch-003", "timezone": "America/New_York", "country_code": "US", "notes": "lab",
+        }
+
+        # Assert: Results in request order, mapped to Site, counts right
+        assert response.status_code == 200
+        data = response.json()
+        assert (data["created"], data["failed"]) == (2, 1)
+        assert [r["status"] for r in data["results"]] == ["created", "failed", "created"]
+        assert data["results"][0]["site"] == {
+            "id": "id-Branch-001", "name": "Branch-001", "address": "1 Main St",
+            "timezone": "America/Chicago", "country_code": "US", "latlng": None,
+            "notes": None, "org_id": "org-1",
+        }
+        assert data["results"][1]["error"] == "duplicate name"
+        invalidate.assert_awaited_once_with("sites")
+
+    def test_cancelled_site_reported_as_failed(self, client, mock_engine):
+        """
+        Test: A cancelled Mist call is reported as a failed site.
+
+        Why: gather(return_exceptions=True) can return BaseException
+        results such as CancelledError; they must not turn into a 500.
+        """
+        # Arrange: One site created, one rejected, one cancelled
+        mock_engine.gather = AsyncMock(return_value=[
+            {"id": "site-1", "name": "Branch-001"},
+            HTTPException(status_code=400, detail="duplicate name"),
+            asyncio.CancelledError(),
+        ])
+        sites = [{"name": "Branch-001"}, {"name": "Branch-002"}, {"name": "Branch-003"}]
+
+        # Act
+        response = client.post("/sites/bulk", json={"sites": sites})
+
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert data["created"] == 1
+        assert data["failed"] == 2
+        assert data["results"][1]["error"] == "duplicate name"
+        assert data["results"][2]["error"] == "CancelledError"
+
+    def test_rejects_oversized_request(self, client, mock_engine):
+        """
+        Test: More than MAX_BULK_SITES sites are rejected up front.
+
+        Why: The concurrency cap limits calls in flight, not their total;
+        an unbounded list would queue thousands of Mist POSTs.
+        """
+        # Arrange
+        sites = [{"name": f"Branch-{i:04d}"} for i in range(MAX_BULK_SITES + 1)]
+
+        # Act
+        response = client.post("/sites/bulk", json={"sites": sites})
+
+        # Assert
+        assert response.status_code == 422
+        mock_engine.post.assert_not_called()